@@ -70,11 +70,20 @@ CREATE TABLE IF NOT EXISTS achievements (
     source VARCHAR(200) NOT NULL,
     source_url TEXT,
     project_id INTEGER REFERENCES projects(id) ON DELETE SET NULL,
+    -- Denormalized copy of alumni.name so read-heavy feeds skip the join;
+    -- write paths set it alongside alumni_id
+    alumni_name_snapshot VARCHAR(100),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    
+
     CONSTRAINT valid_achievement_type CHECK (type IN ('Award', 'Production Credit', 'Festival Selection', 'Review/Reception', 'Industry Recognition'))
 );
 
+-- Upgrade + backfill for databases created before the snapshot column
+ALTER TABLE achievements ADD COLUMN IF NOT EXISTS alumni_name_snapshot VARCHAR(100);
+UPDATE achievements a SET alumni_name_snapshot = al.name
+FROM alumni al
+WHERE a.alumni_id = al.id AND a.alumni_name_snapshot IS NULL;
+
 -- Alumni-Project relationships (many-to-many)
 CREATE TABLE IF NOT EXISTS alumni_projects (
     id SERIAL PRIMARY KEY,
@@ -212,4 +221,37 @@ CREATE INDEX IF NOT EXISTS idx_achievements_alumni_id ON achievements(alumni_id)
 CREATE INDEX IF NOT EXISTS idx_achievements_date ON achievements(date);
 CREATE INDEX IF NOT EXISTS idx_achievements_type ON achievements(type);
 
+-- Functional index backing the dashboard's GROUP BY extract(year FROM date)
+CREATE INDEX IF NOT EXISTS idx_achievements_year ON achievements ((EXTRACT(YEAR FROM date)));
+
+-- Backs the duplicate check in alumni creation/CSV import and enables
+-- INSERT ... ON CONFLICT (name, graduation_year)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_alumni_name_graduation_year ON alumni(name, graduation_year);
+
+-- Serves the automation stat counters and the recent-discoveries feed:
+-- partial on the pipeline's sources (keep the list in sync with
+-- AUTOMATION_SOURCES in main.py), ordered for the created_at DESC feed, and
+-- covering confidence/verified so the counters run as index-only scans.
+CREATE INDEX IF NOT EXISTS idx_achievements_automation_src_created
+    ON achievements (source, created_at DESC)
+    INCLUDE (confidence_score, verified)
+    WHERE source IN ('TMDb API', 'OMDb API', 'Screen Australia', 'IF Magazine', 'AACTA Awards');
+
+-- Daily rollup of pipeline discoveries by source and confidence bucket.
+-- Refreshed (concurrently) by the automation background task after each run;
+-- the source list must stay in sync with AUTOMATION_SOURCES in main.py.
+CREATE MATERIALIZED VIEW IF NOT EXISTS automation_stats_daily AS
+SELECT
+    date_trunc('day', created_at) AS day,
+    source,
+    (confidence_score > 0.8) AS high_conf,
+    count(*) AS discovery_count
+FROM achievements
+WHERE source IN ('TMDb API', 'OMDb API', 'Screen Australia', 'IF Magazine', 'AACTA Awards')
+GROUP BY 1, 2, 3;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS uq_automation_stats_daily
+    ON automation_stats_daily(day, source, high_conf);
+
 COMMIT;
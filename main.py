@@ -1,30 +1,35 @@
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form, WebSocket, WebSocketDisconnect, BackgroundTasks
-from fastapi.responses import HTMLResponse, Response, JSONResponse
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, Form, Query, Request, WebSocket, WebSocketDisconnect, BackgroundTasks
+from fastapi.responses import HTMLResponse, Response, JSONResponse, ORJSONResponse, StreamingResponse
 # Static files removed - using React dev server directly
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text
+from sqlalchemy import select, func, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime, date, timedelta
+from contextlib import asynccontextmanager
 import uvicorn
 import os
 import logging
 import json
 import asyncio
+import io
+import time
+import orjson
 
 # Database imports
 from database.connection import (
     get_database, Alumni, Achievement, Project, ImportLog, DataSource, ProjectStreamingPlatform, AutomationState,
     DegreeProgram, AchievementType, ProjectType, DataSourceType, check_database_health,
-    create_tables, AsyncSessionLocal  # Add AsyncSessionLocal import
+    create_tables, AsyncSessionLocal, engine  # Add AsyncSessionLocal import
 )
 
 # Service imports
 from services.csv_service import CSVImportService
 
 # Pydantic models for API
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from enum import Enum
 
@@ -36,13 +41,18 @@ logger = logging.getLogger(__name__)
 class AlumniCreate(BaseModel):
     name: str
     graduation_year: int
-    degree_program: str
+    # Validated in pydantic-core against the DB enum's values, so invalid
+    # programs get a 422 before the handler runs (and /docs lists them)
+    degree_program: DegreeProgram
     email: Optional[str] = None
     linkedin_url: Optional[str] = None
     imdb_url: Optional[str] = None
     website: Optional[str] = None
 
 class AlumniResponse(BaseModel):
+    # Lets pydantic-core pull fields straight off ORM rows via model_validate
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     graduation_year: int
@@ -117,35 +127,162 @@ class ManualRunRequest(BaseModel):
 
 # ===== WEBSOCKET MANAGER =====
 class ConnectionManager:
+    # Per-connection send-queue depth; when a slow client falls this far
+    # behind, its oldest message is dropped rather than stalling producers
+    SEND_QUEUE_MAXSIZE = 100
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-    
+        self.active_connections: Set[WebSocket] = set()
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._sender_tasks: Dict[WebSocket, asyncio.Task] = {}
+
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.SEND_QUEUE_MAXSIZE)
+        self._queues[websocket] = queue
+        self._sender_tasks[websocket] = asyncio.create_task(self._drain_queue(websocket, queue))
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
-    
+
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self._queues.pop(websocket, None)
+        sender = self._sender_tasks.pop(websocket, None)
+        if sender:
+            sender.cancel()
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
-    
+
+    async def _drain_queue(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Per-connection sender task: client I/O never blocks producers"""
+        try:
+            while True:
+                payload = await queue.get()
+                await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except:
+            self.disconnect(websocket)
+
     async def broadcast(self, message: dict):
-        if not self.active_connections:
+        if not self._queues:
             return
-            
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(json.dumps(message))
-            except:
-                disconnected.append(connection)
-        
-        for connection in disconnected:
-            self.disconnect(connection)
+
+        # Serialize once for all clients; text frames keep the browser-side
+        # JSON.parse(event.data) handlers working unchanged
+        payload = orjson.dumps(message).decode()
+        # O(1) enqueue per client; the sender tasks do the actual socket I/O
+        for queue in list(self._queues.values()):
+            if queue.full():
+                try:
+                    queue.get_nowait()  # drop-oldest for laggards
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(payload)
 
 manager = ConnectionManager()
 
+# ===== DASHBOARD STATS CACHE =====
+# Dashboard aggregations only change when alumni/achievement data changes, so
+# repeat requests are served from memory until the data version is bumped or
+# the TTL expires (TTL covers writes that bypass this API, e.g. automation).
+DASHBOARD_CACHE_TTL_SECONDS = 30.0
+
+_dashboard_data_version = 0
+_dashboard_cache: Optional[Dict[str, Any]] = None  # {"version", "expires", "stats"}
+_dashboard_cache_lock = asyncio.Lock()
+
+def _dashboard_cache_fresh(cached: Optional[Dict[str, Any]]) -> bool:
+    return bool(
+        cached
+        and cached["version"] == _dashboard_data_version
+        and cached["expires"] > time.monotonic()
+    )
+
+def invalidate_dashboard_cache():
+    """Mark dashboard data as changed so cached stats are recomputed"""
+    global _dashboard_data_version, _dashboard_cache
+    _dashboard_data_version += 1
+    _dashboard_cache = None
+
+# ===== AUTOMATION RESPONSE CACHE =====
+# Automation status/sources data moves on the order of minutes (runs are
+# scheduled hours apart), so those endpoints serve from a short TTL cache.
+# Expired entries are kept as a stale fallback when a refresh fails.
+AUTOMATION_CACHE_TTL_SECONDS = 15.0
+
+_automation_response_cache: Dict[str, Dict[str, Any]] = {}  # key -> {"expires", "value"}
+
+def _automation_cache_get(key: str) -> Optional[Any]:
+    cached = _automation_response_cache.get(key)
+    if cached and cached["expires"] > time.monotonic():
+        return cached["value"]
+    return None
+
+def _automation_cache_put(key: str, value: Any) -> None:
+    _automation_response_cache[key] = {
+        "expires": time.monotonic() + AUTOMATION_CACHE_TTL_SECONDS,
+        "value": value
+    }
+
+def _automation_cache_stale(key: str) -> Optional[Any]:
+    """Last known value regardless of freshness, for serve-stale-on-error"""
+    cached = _automation_response_cache.get(key)
+    return cached["value"] if cached else None
+
+def invalidate_automation_cache():
+    """Drop cached automation responses after a toggle or discovery run"""
+    global _automation_db_state
+    _automation_response_cache.clear()
+    _automation_db_state = None
+
+# Timestamps for high-frequency payloads (health probes, WS broadcasts,
+# heartbeats) are formatted at most once per second instead of constructing
+# and serializing a fresh datetime on every call
+_last_iso_second = 0
+_last_iso_timestamp = ""
+
+def _cached_utc_iso() -> str:
+    global _last_iso_second, _last_iso_timestamp
+    second = int(time.time())
+    if second != _last_iso_second:
+        _last_iso_second = second
+        _last_iso_timestamp = datetime.utcfromtimestamp(second).isoformat()
+    return _last_iso_timestamp
+
+# ===== RATE LIMITING =====
+# Automation mutations kick off background pipeline runs and broadcast to
+# every WebSocket client, so they're throttled per client IP with a fixed
+# window. Counters are in-process, like the rest of the caching here.
+RATE_LIMIT_MAX_CALLS = 10
+RATE_LIMIT_WINDOW_SECONDS = 60.0
+# Prune expired windows once the dict reaches this size so one-off client IPs
+# don't accumulate for the process lifetime
+RATE_LIMIT_PRUNE_THRESHOLD = 1024
+
+_rate_limit_counters: Dict[str, Dict[str, float]] = {}  # key -> {"start", "count"}
+
+async def rate_limit(request: Request):
+    """Dependency gating mutation endpoints to RATE_LIMIT_MAX_CALLS per window"""
+    client_host = request.client.host if request.client else "unknown"
+    key = f"{request.url.path}:{client_host}"
+    now = time.monotonic()
+
+    counter = _rate_limit_counters.get(key)
+    if counter is None or now - counter["start"] >= RATE_LIMIT_WINDOW_SECONDS:
+        if len(_rate_limit_counters) >= RATE_LIMIT_PRUNE_THRESHOLD:
+            expired = [
+                tracked_key for tracked_key, tracked in _rate_limit_counters.items()
+                if now - tracked["start"] >= RATE_LIMIT_WINDOW_SECONDS
+            ]
+            for tracked_key in expired:
+                del _rate_limit_counters[tracked_key]
+        _rate_limit_counters[key] = {"start": now, "count": 1}
+        return
+
+    counter["count"] += 1
+    if counter["count"] > RATE_LIMIT_MAX_CALLS:
+        raise HTTPException(status_code=429, detail="Too many requests - please slow down")
+
 # ===== AUTOMATION STATE =====
 automation_state = {
     "status": AutomationStatus.STOPPED,
@@ -155,6 +292,40 @@ automation_state = {
 
 # ===== DISCOVERY PIPELINE FRAMEWORK =====
 
+# Confidence scoring tables, built once at import instead of per discovery
+_SOURCE_BONUSES = {
+    "TMDb API": 0.2,
+    "OMDb API": 0.25,
+    "Screen Australia": 0.3,  # Official government source
+    "AACTA Awards": 0.35,     # Official awards body
+    "IF Magazine": 0.15       # Industry publication
+}
+
+_FACTOR_BONUSES = {
+    "exact_name_match": 0.2,
+    "name_match": 0.15,
+    "graduation_year": 0.1,
+    "official_announcement": 0.25,
+    "byline_match": 0.15,
+    "bio_details": 0.1,
+    "official_nomination_list": 0.3
+}
+
+_TYPE_MULTIPLIERS = {
+    "Award": 1.1,
+    "Industry Recognition": 1.05,
+    "Production Credit": 1.0,
+    "Festival Selection": 1.0,
+    "Review/Reception": 0.9
+}
+
+# One dict hit per discovery instead of EnumMeta.__call__'s member scan
+_ACHIEVEMENT_TYPE_BY_VALUE = {at.value: at for at in AchievementType}
+
+# Source names fed by the discovery pipeline; built once and shared by the
+# automation stats/discovery filters instead of re-listing them per request
+AUTOMATION_SOURCES = ('TMDb API', 'OMDb API', 'Screen Australia', 'IF Magazine', 'AACTA Awards')
+
 class DiscoveryPipeline:
     """Core discovery pipeline for processing data sources and finding achievements"""
     
@@ -163,32 +334,60 @@ class DiscoveryPipeline:
         self.discoveries = []
         self.processed_sources = 0
         self.total_sources = 0
-        
+        # Achievements accumulated during the run, flushed in one commit
+        self._pending: List[tuple] = []  # (Achievement, discovery dict)
+        # (alumni_id, title, source) keys already in the DB, prefetched once
+        # per run so duplicate checks are set lookups instead of SELECTs
+        self._existing_keys: Set[tuple] = set()
+        # Alumni batch shared by all API sources in a run; identical for every
+        # source, so it's fetched once in run_discovery
+        self.alumni_cache: Optional[List[Alumni]] = None
+        # Single hash lookup per source instead of an if/elif chain
+        self._source_processors = {
+            DataSourceType.API: self._process_api_source,
+            DataSourceType.RSS: self._process_rss_source,
+            DataSourceType.WEB_SCRAPING: self._process_web_scraping_source
+        }
+
     async def run_discovery(self) -> Dict[str, Any]:
         """Main discovery pipeline execution"""
         try:
             # Get active data sources
             sources = await self._get_active_sources()
             self.total_sources = len(sources)
-            
+            await self._load_existing_keys(sources)
+
+            alumni_result = await self.session.execute(select(Alumni).limit(10))  # Limit for development
+            self.alumni_cache = alumni_result.scalars().all()
+
             logger.info(f"Starting discovery pipeline with {self.total_sources} active sources")
             
-            # Process each source
-            for source in sources:
-                try:
-                    discoveries = await self._process_data_source(source)
-                    for discovery in discoveries:
-                        confidence = await self._calculate_confidence_score(discovery, source)
-                        await self._save_discovery(discovery, confidence, source)
-                        self.discoveries.append(discovery)
-                    
-                    self.processed_sources += 1
-                    await self._update_source_stats(source, success=True)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing source {source.name}: {e}")
-                    await self._update_source_stats(source, success=False, error=str(e))
-            
+            # Sources are independent I/O work, so process them concurrently:
+            # total time becomes max(per-source latency) instead of the sum.
+            # Everything session-bound (dedup set, pending rows, source stats)
+            # happens sequentially afterwards because AsyncSession is not safe
+            # for concurrent use.
+            results = await asyncio.gather(
+                *(self._process_data_source(source) for source in sources),
+                return_exceptions=True
+            )
+
+            for source, outcome in zip(sources, results):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error processing source {source.name}: {outcome}")
+                    self._update_source_stats(source, success=False, error=str(outcome))
+                    continue
+
+                for discovery in outcome:
+                    confidence = self._calculate_confidence_score(discovery, source)
+                    await self._save_discovery(discovery, confidence, source)
+                    self.discoveries.append(discovery)
+
+                self.processed_sources += 1
+                self._update_source_stats(source, success=True)
+
+            await self._flush_pending()
+
             result = {
                 "total_sources": self.total_sources,
                 "processed_sources": self.processed_sources,
@@ -208,19 +407,27 @@ class DiscoveryPipeline:
         query = select(DataSource).where(DataSource.active == True).order_by(DataSource.name)
         result = await self.session.execute(query)
         return result.scalars().all()
+
+    async def _load_existing_keys(self, sources: List[DataSource]):
+        """Prefetch dedup keys for this run's sources in a single query"""
+        if not sources:
+            self._existing_keys = set()
+            return
+        existing = await self.session.execute(
+            select(Achievement.alumni_id, Achievement.title, Achievement.source)
+            .where(Achievement.source.in_([source.name for source in sources]))
+        )
+        self._existing_keys = set(existing.all())
     
     async def _process_data_source(self, source: DataSource) -> List[Dict[str, Any]]:
         """Process individual data source based on type"""
         discoveries = []
         
         try:
-            if source.type == DataSourceType.API:
-                discoveries = await self._process_api_source(source)
-            elif source.type == DataSourceType.RSS:
-                discoveries = await self._process_rss_source(source)
-            elif source.type == DataSourceType.WEB_SCRAPING:
-                discoveries = await self._process_web_scraping_source(source)
-            
+            processor = self._source_processors.get(source.type)
+            if processor:
+                discoveries = await processor(source)
+
             logger.info(f"Source {source.name} yielded {len(discoveries)} potential discoveries")
             
         except Exception as e:
@@ -231,12 +438,10 @@ class DiscoveryPipeline:
     async def _process_api_source(self, source: DataSource) -> List[Dict[str, Any]]:
         """Process API-based data sources (TMDb, OMDb, etc.)"""
         discoveries = []
-        
-        # Get alumni to search for
-        alumni_query = select(Alumni).limit(10)  # Limit for development
-        alumni_result = await self.session.execute(alumni_query)
-        alumni = alumni_result.scalars().all()
-        
+
+        # Alumni to search for - fetched once per run in run_discovery
+        alumni = self.alumni_cache or []
+
         for alumnus in alumni:
             # Simulate API discovery for each alumnus
             if source.name == "TMDb API":
@@ -320,47 +525,26 @@ class DiscoveryPipeline:
         
         return discoveries
     
-    async def _calculate_confidence_score(self, discovery: Dict[str, Any], source: DataSource) -> float:
-        """Calculate confidence score for a discovery"""
+    def _calculate_confidence_score(self, discovery: Dict[str, Any], source: DataSource) -> float:
+        """Calculate confidence score for a discovery
+
+        Sync on purpose: it awaits nothing, and a coroutine per discovery is
+        avoidable allocation on the pipeline's hot path.
+        """
         base_confidence = 0.5
         confidence_factors = discovery.get("raw_data", {}).get("confidence_factors", [])
-        
+
         # Source reliability bonus
-        source_bonuses = {
-            "TMDb API": 0.2,
-            "OMDb API": 0.25,
-            "Screen Australia": 0.3,  # Official government source
-            "AACTA Awards": 0.35,     # Official awards body
-            "IF Magazine": 0.15       # Industry publication
-        }
-        base_confidence += source_bonuses.get(source.name, 0.1)
-        
+        base_confidence += _SOURCE_BONUSES.get(source.name, 0.1)
+
         # Confidence factor bonuses
-        factor_bonuses = {
-            "exact_name_match": 0.2,
-            "name_match": 0.15,
-            "graduation_year": 0.1,
-            "official_announcement": 0.25,
-            "byline_match": 0.15,
-            "bio_details": 0.1,
-            "official_nomination_list": 0.3
-        }
-        
         for factor in confidence_factors:
-            base_confidence += factor_bonuses.get(factor, 0.05)
-        
+            base_confidence += _FACTOR_BONUSES.get(factor, 0.05)
+
         # Achievement type reliability
-        type_multipliers = {
-            "Award": 1.1,
-            "Industry Recognition": 1.05,
-            "Production Credit": 1.0,
-            "Festival Selection": 1.0,
-            "Review/Reception": 0.9
-        }
-        
         achievement_type = discovery.get("achievement_type", "Production Credit")
-        base_confidence *= type_multipliers.get(achievement_type, 1.0)
-        
+        base_confidence *= _TYPE_MULTIPLIERS.get(achievement_type, 1.0)
+
         # Cap confidence at 1.0
         return min(base_confidence, 1.0)
     
@@ -372,37 +556,50 @@ class DiscoveryPipeline:
             logger.info(f"Skipping low confidence discovery: {discovery['title']} (confidence: {confidence:.2f})")
             return
         
-        # Check for duplicates
-        existing_query = select(Achievement).where(
-            Achievement.alumni_id == discovery["alumni_id"],
-            Achievement.title == discovery["title"],
-            Achievement.source == source.name
-        )
-        existing_result = await self.session.execute(existing_query)
-        if existing_result.scalar_one_or_none():
+        # Check for duplicates against the prefetched key set (also catches
+        # repeats within this run)
+        key = (discovery["alumni_id"], discovery["title"], source.name)
+        if key in self._existing_keys:
             logger.info(f"Duplicate discovery skipped: {discovery['title']}")
             return
-        
-        # Create new achievement
+        self._existing_keys.add(key)
+
+
+        # Queue the achievement; the whole run is flushed in one commit so N
+        # discoveries cost one round-trip/fsync instead of N
+        achievement = Achievement(
+            alumni_id=discovery["alumni_id"],
+            alumni_name_snapshot=discovery["alumni_name"],
+            type=_ACHIEVEMENT_TYPE_BY_VALUE[discovery["achievement_type"]],
+            title=discovery["title"],
+            date=discovery["date"],
+            description=discovery["description"],
+            confidence_score=confidence,
+            verified=False,  # All discoveries start unverified
+            source=source.name,
+            source_url=discovery.get("source_url")
+        )
+        self._pending.append((achievement, discovery))
+
+    async def _flush_pending(self):
+        """Commit queued achievements and dirty source stats, then broadcast"""
         try:
-            achievement = Achievement(
-                alumni_id=discovery["alumni_id"],
-                type=AchievementType(discovery["achievement_type"]),
-                title=discovery["title"],
-                date=discovery["date"],
-                description=discovery["description"],
-                confidence_score=confidence,
-                verified=False,  # All discoveries start unverified
-                source=source.name,
-                source_url=discovery.get("source_url")
-            )
-            
-            self.session.add(achievement)
+            if self._pending:
+                self.session.add_all([achievement for achievement, _ in self._pending])
+            # One commit covers the new achievements and every DataSource
+            # mutated by _update_source_stats during this run
             await self.session.commit()
-            
-            logger.info(f"Saved new achievement: {discovery['title']} (confidence: {confidence:.2f})")
-            
-            # Broadcast new discovery via WebSocket
+            if self._pending:
+                logger.info(f"Saved {len(self._pending)} new achievements in one commit")
+        except Exception as e:
+            logger.error(f"Failed to save discoveries: {e}")
+            await self.session.rollback()
+            self._pending = []
+            return
+
+        # Broadcast after the commit so IDs are assigned and clients never see
+        # a discovery that later rolled back
+        for achievement, discovery in self._pending:
             await manager.broadcast({
                 "type": "new_discovery",
                 "discovery": {
@@ -410,46 +607,56 @@ class DiscoveryPipeline:
                     "title": achievement.title,
                     "alumni_name": discovery["alumni_name"],
                     "achievement_type": achievement.type.value,
-                    "source": source.name,
-                    "confidence": float(confidence),
-                    "timestamp": datetime.now().isoformat(),
+                    "source": achievement.source,
+                    "confidence": float(achievement.confidence_score),
+                    "timestamp": _cached_utc_iso(),
                     "source_url": discovery.get("source_url"),
                     "verified": False
                 }
             })
-            
-        except Exception as e:
-            logger.error(f"Failed to save discovery: {e}")
-            await self.session.rollback()
+        self._pending = []
     
-    async def _update_source_stats(self, source: DataSource, success: bool, error: str = None):
-        """Update data source statistics after processing"""
-        try:
-            source.last_checked = datetime.now()
-            
-            if success:
-                # Improve success rate
-                current_rate = source.success_rate or 0.8
-                source.success_rate = min(current_rate + 0.1, 1.0)
-                source.last_error = None
-            else:
-                # Decrease success rate
-                current_rate = source.success_rate or 0.8
-                source.success_rate = max(current_rate - 0.2, 0.1)
-                source.last_error = error
-            
-            await self.session.commit()
-            
-        except Exception as e:
-            logger.error(f"Failed to update source stats for {source.name}: {e}")
+    def _update_source_stats(self, source: DataSource, success: bool, error: str = None):
+        """Update data source statistics after processing
+
+        Only mutates the ORM object; all dirty sources flush in the single
+        run-level commit (_flush_pending), so S sources cost one WAL sync.
+        """
+        source.last_checked = datetime.now()
+
+        if success:
+            # Improve success rate
+            current_rate = source.success_rate or 0.8
+            source.success_rate = min(current_rate + 0.1, 1.0)
+            source.last_error = None
+        else:
+            # Decrease success rate
+            current_rate = source.success_rate or 0.8
+            source.success_rate = max(current_rate - 0.2, 0.1)
+            source.last_error = error
 
 # ===== AUTOMATION STATE MANAGEMENT =====
+# The automation_state table holds one logical row; it's cached per process so
+# reads (heartbeats, status endpoint) are memory hits and updates write
+# through with a single UPDATE instead of SELECT + commit + refresh. The TTL
+# bounds staleness across workers: a toggle on a sibling worker shows up here
+# within one expiry, and invalidate_automation_cache() clears it immediately
+# in the process that made the change.
+AUTOMATION_STATE_TTL_SECONDS = 15.0
+
+_automation_db_state: Optional[AutomationState] = None
+_automation_db_state_expires = 0.0
+
 async def get_automation_state(session: AsyncSession) -> AutomationState:
-    """Get current automation state from database, create if not exists"""
+    """Get current automation state (cached with TTL), create if not exists"""
+    global _automation_db_state, _automation_db_state_expires
+    if _automation_db_state is not None and time.monotonic() < _automation_db_state_expires:
+        return _automation_db_state
+
     query = select(AutomationState).order_by(AutomationState.id.desc()).limit(1)
     result = await session.execute(query)
     state = result.scalar_one_or_none()
-    
+
     if not state:
         # Create initial state
         state = AutomationState(
@@ -461,38 +668,52 @@ async def get_automation_state(session: AsyncSession) -> AutomationState:
         session.add(state)
         await session.commit()
         await session.refresh(state)
-    
+
+    _automation_db_state = state
+    _automation_db_state_expires = time.monotonic() + AUTOMATION_STATE_TTL_SECONDS
     return state
 
 async def update_automation_state(session: AsyncSession, **kwargs) -> AutomationState:
-    """Update automation state in database"""
+    """Update automation state in database and the cached copy"""
     state = await get_automation_state(session)
-    
-    for key, value in kwargs.items():
-        if hasattr(state, key):
+
+    changes = {key: value for key, value in kwargs.items() if hasattr(state, key)}
+    if changes:
+        for key, value in changes.items():
             setattr(state, key, value)
-    
-    await session.commit()
-    await session.refresh(state)
+        await session.execute(
+            update(AutomationState).where(AutomationState.id == state.id).values(**changes)
+        )
+        await session.commit()
+
     return state
 
+# Lifespan: ensure tables exist and pre-warm the connection pool so the
+# first real request doesn't pay connection-establishment cost
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await create_tables()
+        logger.info("Database tables created successfully")
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        logger.info("Database connection pool warmed")
+    except Exception as e:
+        logger.error(f"Error during startup: {str(e)}")
+    heartbeat_task = asyncio.create_task(_heartbeat_publisher())
+    yield
+    heartbeat_task.cancel()
+    await engine.dispose()
+
 # Create FastAPI app
 app = FastAPI(
     title="AlumDash - Alumni Achievement Tracking System",
     description="Track and monitor achievements of film and television alumni with automated discovery",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Startup event to ensure tables exist
-@app.on_event("startup")
-async def startup_event():
-    """Create database tables on startup"""
-    try:
-        await create_tables()
-        logger.info("Database tables created successfully")
-    except Exception as e:
-        logger.error(f"Error creating database tables: {str(e)}")
-
 # Enable CORS
 app.add_middleware(
     CORSMiddleware,
@@ -511,9 +732,9 @@ app.add_middleware(
 async def health_check():
     """Health check endpoint for Docker and monitoring"""
     db_healthy = await check_database_health()
-    
+
     if db_healthy:
-        return {"status": "healthy", "database": "connected", "timestamp": datetime.utcnow()}
+        return {"status": "healthy", "database": "connected", "timestamp": _cached_utc_iso()}
     else:
         raise HTTPException(status_code=503, detail="Database connection failed")
 
@@ -523,29 +744,51 @@ async def root():
     """API root - React frontend served separately on port 5173"""
     return {"message": "AlumDash API is running", "frontend_url": "http://localhost:5173", "docs": "http://localhost:8000/docs"}
 
+# Columns fetched for alumni responses - selecting Core rows instead of full
+# ORM entities skips identity-map hydration on the hot list path
+ALUMNI_RESPONSE_COLUMNS = (
+    Alumni.id,
+    Alumni.name,
+    Alumni.graduation_year,
+    Alumni.degree_program,
+    Alumni.email,
+    Alumni.linkedin_url,
+    Alumni.imdb_url,
+    Alumni.website,
+    Alumni.created_at,
+    Alumni.updated_at,
+)
+
 # Alumni endpoints (EXISTING - keeping as is)
-@app.get("/api/alumni", response_model=List[AlumniResponse])
-async def get_alumni(session: AsyncSession = Depends(get_database)):
-    """Get all alumni records"""
+# response_model omitted on purpose: rows are model_construct-ed straight from
+# the schema and a response_model would re-validate every field per row
+@app.get("/api/alumni")
+async def get_alumni(
+    after: Optional[str] = Query(None, description="Keyset cursor: return alumni with names after this value"),
+    after_id: Optional[int] = Query(None, description="Tie-breaker cursor: id of the last row of the previous page"),
+    limit: int = Query(100, ge=1, le=500),
+    session: AsyncSession = Depends(get_database)
+):
+    """Get alumni records, keyset-paginated by (name, id)
+
+    Pass the last row's name and id of the previous page as `after` and
+    `after_id` to fetch the next page; a short page signals the end of the
+    data. The id tie-breaker keeps alumni sharing a name from being skipped
+    at page boundaries (names alone aren't unique).
+    """
     try:
-        query = select(Alumni).order_by(Alumni.name)
+        query = select(*ALUMNI_RESPONSE_COLUMNS).order_by(Alumni.name, Alumni.id).limit(limit)
+        if after is not None:
+            if after_id is not None:
+                query = query.where(tuple_(Alumni.name, Alumni.id) > (after, after_id))
+            else:
+                query = query.where(Alumni.name > after)
         result = await session.execute(query)
-        alumni = result.scalars().all()
-        
+
+        # Rows come straight from the schema, so skip per-field validation
         return [
-            AlumniResponse(
-                id=alumnus.id,
-                name=alumnus.name,
-                graduation_year=alumnus.graduation_year,
-                degree_program=alumnus.degree_program,
-                email=alumnus.email,
-                linkedin_url=alumnus.linkedin_url,
-                imdb_url=alumnus.imdb_url,
-                website=alumnus.website,
-                created_at=alumnus.created_at,
-                updated_at=alumnus.updated_at
-            )
-            for alumnus in alumni
+            AlumniResponse.model_construct(**row._mapping)
+            for row in result.all()
         ]
     except Exception as e:
         logger.error(f"Error fetching alumni: {str(e)}")
@@ -561,19 +804,8 @@ async def get_alumni_by_id(alumni_id: int, session: AsyncSession = Depends(get_d
         
         if not alumnus:
             raise HTTPException(status_code=404, detail="Alumni not found")
-        
-        return AlumniResponse(
-            id=alumnus.id,
-            name=alumnus.name,
-            graduation_year=alumnus.graduation_year,
-            degree_program=alumnus.degree_program,
-            email=alumnus.email,
-            linkedin_url=alumnus.linkedin_url,
-            imdb_url=alumnus.imdb_url,
-            website=alumnus.website,
-            created_at=alumnus.created_at,
-            updated_at=alumnus.updated_at
-        )
+
+        return AlumniResponse.model_validate(alumnus)
     except HTTPException:
         raise
     except Exception as e:
@@ -584,47 +816,33 @@ async def get_alumni_by_id(alumni_id: int, session: AsyncSession = Depends(get_d
 async def create_alumni(alumni_data: AlumniCreate, session: AsyncSession = Depends(get_database)):
     """Create new alumni record"""
     try:
-        # Validate degree program
-        valid_programs = ["Film Production", "Screenwriting", "Animation", "Documentary", "Television"]
-        if alumni_data.degree_program not in valid_programs:
-            raise HTTPException(status_code=400, detail="Invalid degree program")
-        
-        # Check for duplicate
-        existing_query = select(Alumni).where(
-            Alumni.name == alumni_data.name,
-            Alumni.graduation_year == alumni_data.graduation_year
+        # Insert in a single round-trip; the unique index on
+        # (name, graduation_year) resolves duplicates race-free and RETURNING
+        # hands back the server-generated id/timestamps without a refresh
+        stmt = (
+            pg_insert(Alumni)
+            .values(
+                name=alumni_data.name,
+                graduation_year=alumni_data.graduation_year,
+                degree_program=alumni_data.degree_program,
+                email=alumni_data.email,
+                linkedin_url=alumni_data.linkedin_url,
+                imdb_url=alumni_data.imdb_url,
+                website=alumni_data.website
+            )
+            .on_conflict_do_nothing(index_elements=['name', 'graduation_year'])
+            .returning(*ALUMNI_RESPONSE_COLUMNS)
         )
-        existing = await session.execute(existing_query)
-        if existing.scalar_one_or_none():
+        result = await session.execute(stmt)
+        row = result.one_or_none()
+
+        if row is None:
             raise HTTPException(status_code=400, detail="Alumni with this name and graduation year already exists")
-        
-        # Create new alumni
-        new_alumni = Alumni(
-            name=alumni_data.name,
-            graduation_year=alumni_data.graduation_year,
-            degree_program=alumni_data.degree_program,
-            email=alumni_data.email,
-            linkedin_url=alumni_data.linkedin_url,
-            imdb_url=alumni_data.imdb_url,
-            website=alumni_data.website
-        )
-        
-        session.add(new_alumni)
+
         await session.commit()
-        await session.refresh(new_alumni)
-        
-        return AlumniResponse(
-            id=new_alumni.id,
-            name=new_alumni.name,
-            graduation_year=new_alumni.graduation_year,
-            degree_program=new_alumni.degree_program,
-            email=new_alumni.email,
-            linkedin_url=new_alumni.linkedin_url,
-            imdb_url=new_alumni.imdb_url,
-            website=new_alumni.website,
-            created_at=new_alumni.created_at,
-            updated_at=new_alumni.updated_at
-        )
+        invalidate_dashboard_cache()
+
+        return AlumniResponse.model_construct(**row._mapping)
     except HTTPException:
         raise
     except Exception as e:
@@ -641,17 +859,21 @@ async def import_alumni_csv(
     try:
         if not file.filename.endswith('.csv'):
             raise HTTPException(status_code=400, detail="File must be a CSV file")
-        
-        content = await file.read()
-        csv_content = content.decode('utf-8')
-        
+
+        # Stream the upload into the parser instead of buffering the whole
+        # file twice (raw bytes + decoded str) in memory
+        csv_stream = io.TextIOWrapper(file.file, encoding='utf-8', newline='')
+
         result = await CSVImportService.import_alumni_csv(
             session=session,
-            csv_content=csv_content,
+            csv_source=csv_stream,
             filename=file.filename,
             imported_by="web_upload"
         )
-        
+
+        if result.get('success'):
+            invalidate_dashboard_cache()
+
         return ImportResult(**result)
         
     except HTTPException:
@@ -664,10 +886,10 @@ async def import_alumni_csv(
 async def download_csv_template():
     """Download CSV template for alumni import"""
     try:
-        template_csv = CSVImportService.generate_csv_template()
-        
-        return Response(
-            content=template_csv,
+        # Stream line by line so the response starts immediately and memory
+        # stays O(row) even if the template grows
+        return StreamingResponse(
+            CSVImportService.iter_csv_template(),
             media_type="text/csv",
             headers={"Content-Disposition": "attachment; filename=alumni_import_template.csv"}
         )
@@ -685,80 +907,96 @@ async def get_import_history(session: AsyncSession = Depends(get_database)):
         raise HTTPException(status_code=500, detail="Error fetching import history")
 
 # Dashboard endpoint (EXISTING)
-@app.get("/api/dashboard/stats", response_model=DashboardStats)
+@app.get("/api/dashboard/stats")
 async def get_dashboard_stats(session: AsyncSession = Depends(get_database)):
     """Get dashboard statistics"""
+    global _dashboard_cache
     try:
-        alumni_count_query = select(func.count(Alumni.id))
-        alumni_count = await session.execute(alumni_count_query)
-        total_alumni = alumni_count.scalar()
-        
-        achievements_count_query = select(func.count(Achievement.id))
-        achievements_count = await session.execute(achievements_count_query)
-        total_achievements = achievements_count.scalar()
-        
-        projects_count_query = select(func.count(Project.id))
-        projects_count = await session.execute(projects_count_query)
-        total_projects = projects_count.scalar()
-        
-        # Get recent achievements
-        recent_achievements_query = (
-            select(Achievement, Alumni.name)
-            .join(Alumni, Achievement.alumni_id == Alumni.id)
-            .order_by(Achievement.date.desc())
-            .limit(5)
-        )
-        recent_result = await session.execute(recent_achievements_query)
-        recent_achievements = [
-            {
-                "title": achievement.title,
-                "alumni_name": alumni_name,
-                "date": achievement.date.isoformat(),
-                "type": achievement.type.value
-            }
-            for achievement, alumni_name in recent_result.all()
-        ]
-        
-        # Get achievements by year
-        achievements_by_year_query = (
-            select(func.extract('year', Achievement.date), func.count(Achievement.id))
-            .group_by(func.extract('year', Achievement.date))
-            .order_by(func.extract('year', Achievement.date))
-        )
-        year_result = await session.execute(achievements_by_year_query)
-        achievements_by_year = {int(year): count for year, count in year_result.all()}
-        
-        # Get top achievers
-        top_achievers_query = (
-            select(Alumni.name, Alumni.graduation_year, func.count(Achievement.id).label('achievement_count'))
-            .join(Achievement, Alumni.id == Achievement.alumni_id)
-            .group_by(Alumni.id, Alumni.name, Alumni.graduation_year)
-            .order_by(func.count(Achievement.id).desc())
-            .limit(5)
-        )
-        top_result = await session.execute(top_achievers_query)
-        top_achievers = [
-            {
-                "name": name,
-                "graduation_year": graduation_year,
-                "achievement_count": achievement_count
+        cached = _dashboard_cache
+        if _dashboard_cache_fresh(cached):
+            return cached["stats"]
+
+        # Serialize cache misses so a burst of dashboard loads runs the
+        # aggregation queries once, not once per request
+        async with _dashboard_cache_lock:
+            cached = _dashboard_cache
+            if _dashboard_cache_fresh(cached):
+                return cached["stats"]
+
+            stats = await _compute_dashboard_stats(session)
+            _dashboard_cache = {
+                "version": _dashboard_data_version,
+                "expires": time.monotonic() + DASHBOARD_CACHE_TTL_SECONDS,
+                "stats": stats
             }
-            for name, graduation_year, achievement_count in top_result.all()
-        ]
-        
-        return DashboardStats(
-            total_alumni=total_alumni,
-            total_achievements=total_achievements,
-            total_projects=total_projects,
-            recent_achievements=recent_achievements,
-            achievements_by_year=achievements_by_year,
-            top_achievers=top_achievers
-        )
-        
+            return stats
+
     except Exception as e:
         logger.error(f"Error fetching dashboard stats: {str(e)}")
         raise HTTPException(status_code=500, detail="Error fetching dashboard statistics")
 
+# All dashboard aggregations in one statement: Postgres assembles the three
+# list/map sections as JSON and returns everything in a single row, so a cold
+# cache costs one round-trip instead of four sequential ones
+_DASHBOARD_STATS_SQL = text("""
+    WITH counts AS (
+        SELECT
+            (SELECT count(*) FROM alumni) AS total_alumni,
+            (SELECT count(*) FROM achievements) AS total_achievements,
+            (SELECT count(*) FROM projects) AS total_projects
+    ),
+    recent AS (
+        SELECT coalesce(json_agg(json_build_object(
+            'title', r.title,
+            'alumni_name', r.alumni_name,
+            'date', r.date,
+            'type', r.type
+        )), '[]'::json) AS recent_achievements
+        FROM (
+            SELECT ach.title, al.name AS alumni_name, ach.date::text AS date, ach.type
+            FROM achievements ach
+            JOIN alumni al ON ach.alumni_id = al.id
+            ORDER BY ach.date DESC
+            LIMIT 5
+        ) r
+    ),
+    by_year AS (
+        SELECT coalesce(json_object_agg(y.year, y.cnt ORDER BY y.year), '{}'::json) AS achievements_by_year
+        FROM (
+            SELECT extract(year FROM date)::int AS year, count(*) AS cnt
+            FROM achievements
+            GROUP BY 1
+        ) y
+    ),
+    top AS (
+        SELECT coalesce(json_agg(t), '[]'::json) AS top_achievers
+        FROM (
+            SELECT al.name, al.graduation_year, count(ach.id) AS achievement_count
+            FROM alumni al
+            JOIN achievements ach ON ach.alumni_id = al.id
+            GROUP BY al.id, al.name, al.graduation_year
+            ORDER BY count(ach.id) DESC
+            LIMIT 5
+        ) t
+    )
+    SELECT counts.total_alumni, counts.total_achievements, counts.total_projects,
+           recent.recent_achievements, by_year.achievements_by_year, top.top_achievers
+    FROM counts, recent, by_year, top
+""")
+
+async def _compute_dashboard_stats(session: AsyncSession) -> DashboardStats:
+    """Run the single-statement dashboard aggregation and assemble the payload"""
+    row = (await session.execute(_DASHBOARD_STATS_SQL)).one()
+    # asyncpg hands json columns back as strings
+    return DashboardStats(
+        total_alumni=row.total_alumni,
+        total_achievements=row.total_achievements,
+        total_projects=row.total_projects,
+        recent_achievements=json.loads(row.recent_achievements),
+        achievements_by_year={int(year): count for year, count in json.loads(row.achievements_by_year).items()},
+        top_achievers=json.loads(row.top_achievers)
+    )
+
 # ===== NEW AUTOMATION ENDPOINTS =====
 
 @app.websocket("/ws/automation")
@@ -769,33 +1007,52 @@ async def websocket_endpoint(websocket: WebSocket):
         # Send initial status
         async with AsyncSessionLocal() as session:
             db_state = await get_automation_state(session)
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(orjson.dumps({
                 "type": "status_update",
                 "status": db_state.status,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _cached_utc_iso(),
                 "next_scheduled_run": db_state.next_scheduled_run.isoformat() if db_state.next_scheduled_run else None,
                 "run_count": db_state.run_count
-            }))
-        
+            }).decode())
+
+        # Heartbeats arrive via the shared publisher's broadcast; this loop
+        # only keeps the coroutine alive and notices disconnects
         while True:
-            await asyncio.sleep(10)  # Reduced frequency for heartbeat
-            
-            # Send periodic status update with real data
-            async with AsyncSessionLocal() as session:
-                db_state = await get_automation_state(session)
-                await websocket.send_text(json.dumps({
-                    "type": "heartbeat",
-                    "timestamp": datetime.now().isoformat(),
-                    "status": db_state.status,
-                    "last_run_start": db_state.last_run_start.isoformat() if db_state.last_run_start else None,
-                    "last_run_end": db_state.last_run_end.isoformat() if db_state.last_run_end else None
-                }))
+            await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
+HEARTBEAT_INTERVAL_SECONDS = 10
+
+async def _heartbeat_publisher():
+    """Single ticker that broadcasts the heartbeat to every client
+
+    One state read and one serialization per tick regardless of the number of
+    connected clients, instead of a session + query loop per connection.
+    """
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+        if not manager.active_connections:
+            continue
+        try:
+            async with AsyncSessionLocal() as session:
+                db_state = await get_automation_state(session)
+            await manager.broadcast({
+                "type": "heartbeat",
+                "timestamp": _cached_utc_iso(),
+                "status": db_state.status,
+                "last_run_start": db_state.last_run_start.isoformat() if db_state.last_run_start else None,
+                "last_run_end": db_state.last_run_end.isoformat() if db_state.last_run_end else None
+            })
+        except Exception as e:
+            logger.error(f"Heartbeat publisher error: {e}")
+
 @app.get("/api/automation/status", response_model=AutomationStats)
 async def get_automation_status(session: AsyncSession = Depends(get_database)):
     """Get current automation status and statistics from database"""
+    cached = _automation_cache_get("status")
+    if cached is not None:
+        return cached
     try:
         today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
@@ -807,41 +1064,27 @@ async def get_automation_status(session: AsyncSession = Depends(get_database)):
         active_sources = sum(1 for source in all_sources if source.active)
         total_sources = len(all_sources)
         
-        # Query achievements for discovery statistics
-        # Discoveries today - achievements created today with automation sources
-        discoveries_today_query = select(func.count(Achievement.id)).where(
-            Achievement.created_at >= today_start,
-            Achievement.source.in_(['TMDb API', 'OMDb API', 'Screen Australia', 'IF Magazine', 'AACTA Awards'])
-        )
-        discoveries_today_result = await session.execute(discoveries_today_query)
-        discoveries_today = discoveries_today_result.scalar() or 0
-        
-        # High confidence discoveries (confidence > 0.8)
-        high_confidence_query = select(func.count(Achievement.id)).where(
-            Achievement.created_at >= today_start,
-            Achievement.confidence_score > 0.8,
-            Achievement.source.in_(['TMDb API', 'OMDb API', 'Screen Australia', 'IF Magazine', 'AACTA Awards'])
-        )
-        high_confidence_result = await session.execute(high_confidence_query)
-        high_confidence = high_confidence_result.scalar() or 0
-        
-        # Total discoveries (all time automation)
-        total_discoveries_query = select(func.count(Achievement.id)).where(
-            Achievement.source.in_(['TMDb API', 'OMDb API', 'Screen Australia', 'IF Magazine', 'AACTA Awards'])
-        )
-        total_discoveries_result = await session.execute(total_discoveries_query)
-        total_discoveries = total_discoveries_result.scalar() or 0
-        
-        # Calculate discoveries change (compare with yesterday)
+        # All four discovery counters (today, high-confidence, all-time,
+        # yesterday) in one conditional-aggregation query: Postgres scans the
+        # automation achievements once instead of four times
         yesterday_start = today_start - timedelta(days=1)
-        yesterday_query = select(func.count(Achievement.id)).where(
-            Achievement.created_at >= yesterday_start,
-            Achievement.created_at < today_start,
-            Achievement.source.in_(['TMDb API', 'OMDb API', 'Screen Australia', 'IF Magazine', 'AACTA Awards'])
-        )
-        yesterday_result = await session.execute(yesterday_query)
-        yesterday_count = yesterday_result.scalar() or 0
-        
+        counts_query = select(
+            func.count(Achievement.id).filter(
+                Achievement.created_at >= today_start
+            ).label('discoveries_today'),
+            func.count(Achievement.id).filter(
+                Achievement.created_at >= today_start,
+                Achievement.confidence_score > 0.8
+            ).label('high_confidence'),
+            func.count(Achievement.id).label('total_discoveries'),
+            func.count(Achievement.id).filter(
+                Achievement.created_at >= yesterday_start,
+                Achievement.created_at < today_start
+            ).label('yesterday_count')
+        ).where(Achievement.source.in_(AUTOMATION_SOURCES))
+        counts_result = await session.execute(counts_query)
+        discoveries_today, high_confidence, total_discoveries, yesterday_count = counts_result.one()
+
         discoveries_change = 0.0
         if yesterday_count > 0:
             discoveries_change = ((discoveries_today - yesterday_count) / yesterday_count) * 100
@@ -866,8 +1109,8 @@ async def get_automation_status(session: AsyncSession = Depends(get_database)):
         
         # Get automation state from database
         db_state = await get_automation_state(session)
-        
-        return AutomationStats(
+
+        stats = AutomationStats(
             discoveries_today=discoveries_today,
             discoveries_change=round(discoveries_change, 1),
             high_confidence=high_confidence,
@@ -878,14 +1121,22 @@ async def get_automation_status(session: AsyncSession = Depends(get_database)):
             status=AutomationStatus(db_state.status),
             next_scheduled_run=db_state.next_scheduled_run or (datetime.now() + timedelta(hours=6))
         )
-            
+        _automation_cache_put("status", stats)
+        return stats
+
     except Exception as e:
         logger.error(f"Error getting automation status: {e}")
+        stale = _automation_cache_stale("status")
+        if stale is not None:
+            return stale
         raise HTTPException(status_code=500, detail="Error retrieving automation status")
 
 @app.get("/api/automation/sources", response_model=List[DataSourceStatus])
 async def get_data_sources(session: AsyncSession = Depends(get_database)):
     """Get status of all data sources from database"""
+    cached = _automation_cache_get("sources")
+    if cached is not None:
+        return cached
     try:
         # Query real data sources from database
         query = select(DataSource).order_by(DataSource.name)
@@ -925,61 +1176,78 @@ async def get_data_sources(session: AsyncSession = Depends(get_database)):
                 errors=errors
             )
             source_statuses.append(source_status)
-        
+
+        _automation_cache_put("sources", source_statuses)
         return source_statuses
-        
+
     except Exception as e:
         logger.error(f"Error getting data sources: {e}")
+        stale = _automation_cache_stale("sources")
+        if stale is not None:
+            return stale
         raise HTTPException(status_code=500, detail="Error retrieving data sources")
 
 @app.get("/api/automation/discoveries", response_model=List[DiscoveryItem])
-async def get_recent_discoveries(limit: int = 50, verified_only: bool = False, session: AsyncSession = Depends(get_database)):
+async def get_recent_discoveries(
+    limit: int = Query(50, ge=1, le=500),
+    verified_only: bool = False,
+    session: AsyncSession = Depends(get_database)
+):
     """Get recent discoveries from automation"""
+    # Param-keyed so each (limit, verified_only) combination caches
+    # separately; limit is bounded above, so the key space is too
+    cache_key = f"discoveries:{limit}:{verified_only}"
+    cached = _automation_cache_get(cache_key)
+    if cached is not None:
+        return cached
     try:
-        # Query real achievements from automation sources
-        automation_sources = ['TMDb API', 'OMDb API', 'Screen Australia', 'IF Magazine', 'AACTA Awards']
-        
-        query = select(Achievement, Alumni.name).join(
-            Alumni, Achievement.alumni_id == Alumni.id
+        # Select only the columns the response needs - pulling whole
+        # Achievement rows drags the description text (and more) over the
+        # wire for every item. The denormalized name snapshot makes this a
+        # single-table read, no alumni join.
+        query = select(
+            Achievement.id,
+            Achievement.title,
+            Achievement.type,
+            Achievement.source,
+            Achievement.confidence_score,
+            Achievement.created_at,
+            Achievement.source_url,
+            Achievement.verified,
+            Achievement.alumni_name_snapshot.label('alumni_name')
         ).where(
-            Achievement.source.in_(automation_sources)
+            Achievement.source.in_(AUTOMATION_SOURCES)
         ).order_by(Achievement.created_at.desc()).limit(limit)
-        
+
         if verified_only:
             query = query.where(Achievement.verified == True)
-        
+
         result = await session.execute(query)
-        achievement_data = result.all()
-        
-        discoveries = []
-        for achievement, alumni_name in achievement_data:
-            try:
-                # Handle achievement type conversion safely
-                if hasattr(achievement.type, 'value'):
-                    achievement_type_value = achievement.type.value
-                else:
-                    achievement_type_value = str(achievement.type)
-                
-                discovery = DiscoveryItem(
-                    id=str(achievement.id),
-                    title=achievement.title,
-                    alumni_name=alumni_name,
-                    achievement_type=achievement_type_value,
-                    source=achievement.source,
-                    confidence=float(achievement.confidence_score),
-                    timestamp=achievement.created_at.isoformat(),
-                    source_url=achievement.source_url,
-                    verified=achievement.verified
-                )
-                discoveries.append(discovery)
-            except Exception as e:
-                logger.error(f"Error processing achievement {achievement.id}: {e}")
-                # Skip this achievement and continue
-        
+
+        discoveries = [
+            DiscoveryItem(
+                id=str(row.id),
+                title=row.title,
+                alumni_name=row.alumni_name or "",  # pre-backfill rows
+
+                achievement_type=row.type.value,
+                source=row.source,
+                confidence=float(row.confidence_score),
+                timestamp=row.created_at.isoformat(),
+                source_url=row.source_url,
+                verified=row.verified
+            )
+            for row in result.all()
+        ]
+
+        _automation_cache_put(cache_key, discoveries)
         return discoveries
-            
+
     except Exception as e:
         logger.error(f"Error getting discoveries: {e}")
+        stale = _automation_cache_stale(cache_key)
+        if stale is not None:
+            return stale
         raise HTTPException(status_code=500, detail="Error retrieving discoveries")
 
 # Background task function for automation discovery
@@ -998,7 +1266,7 @@ async def run_automation_background_task():
             # Broadcast start notification
             await manager.broadcast({
                 "type": "automation_started",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _cached_utc_iso(),
                 "message": "Discovery pipeline started"
             })
             
@@ -1028,15 +1296,16 @@ async def run_automation_background_task():
                         if first_alumni:
                             # Create a simulated discovery achievement using raw SQL to avoid enum conflicts
                             insert_query = """
-                                INSERT INTO achievements (alumni_id, type, title, date, description, confidence_score, verified, source, source_url)
-                                VALUES (:alumni_id, :type, :title, :date, :description, :confidence_score, :verified, :source, :source_url)
+                                INSERT INTO achievements (alumni_id, alumni_name_snapshot, type, title, date, description, confidence_score, verified, source, source_url)
+                                VALUES (:alumni_id, :alumni_name_snapshot, :type, :title, :date, :description, :confidence_score, :verified, :source, :source_url)
                                 RETURNING id, created_at
                             """
-                            
+
                             result = await session.execute(
                                 text(insert_query),
                                 {
                                     "alumni_id": first_alumni.id,
+                                    "alumni_name_snapshot": first_alumni.name,
                                     "type": "Production Credit",  # Use value that matches CHECK constraint
                                     "title": f"New Discovery from {source.name}",
                                     "date": datetime.now().date(),
@@ -1098,7 +1367,7 @@ async def run_automation_background_task():
             # Broadcast completion
             await manager.broadcast({
                 "type": "automation_completed",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _cached_utc_iso(),
                 "result": {
                     "discoveries_found": discoveries_count,
                     "sources_processed": processed_count,
@@ -1106,6 +1375,19 @@ async def run_automation_background_task():
                 }
             })
             
+            # Keep the daily rollup current; concurrent refresh doesn't block
+            # readers but Postgres forbids it inside a transaction block, so
+            # it needs an AUTOCOMMIT connection rather than the session.
+            # Guarded because dev databases created via create_tables() alone
+            # (without init.sql) lack the view.
+            try:
+                async with engine.connect() as refresh_conn:
+                    autocommit_conn = await refresh_conn.execution_options(isolation_level="AUTOCOMMIT")
+                    await autocommit_conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY automation_stats_daily"))
+            except Exception as refresh_error:
+                logger.warning(f"Could not refresh automation_stats_daily: {refresh_error}")
+
+            invalidate_automation_cache()
             logger.info(f"Automation run completed successfully: {discoveries_count} discoveries, {processed_count} sources processed")
             
     except Exception as e:
@@ -1126,13 +1408,13 @@ async def run_automation_background_task():
         try:
             await manager.broadcast({
                 "type": "automation_error",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _cached_utc_iso(),
                 "error": str(e)
             })
         except Exception as broadcast_error:
             logger.error(f"Failed to broadcast error: {broadcast_error}")
 
-@app.post("/api/automation/toggle")
+@app.post("/api/automation/toggle", dependencies=[Depends(rate_limit)])
 async def toggle_automation(request: AutomationToggleRequest, background_tasks: BackgroundTasks, session: AsyncSession = Depends(get_database)):
     """Start or stop the automation system"""
     try:
@@ -1147,14 +1429,15 @@ async def toggle_automation(request: AutomationToggleRequest, background_tasks:
             
             # Start background automation task
             background_tasks.add_task(run_automation_background_task)
-            
+
             # Update in-memory state for compatibility
             automation_state["status"] = AutomationStatus.RUNNING
+            invalidate_automation_cache()
             
             await manager.broadcast({
                 "type": "status_change",
                 "status": "running",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _cached_utc_iso()
             })
             
             return {"message": "Automation started successfully", "status": "running"}
@@ -1169,11 +1452,12 @@ async def toggle_automation(request: AutomationToggleRequest, background_tasks:
             
             # Update in-memory state for compatibility
             automation_state["status"] = AutomationStatus.STOPPED
+            invalidate_automation_cache()
             
             await manager.broadcast({
                 "type": "status_change", 
                 "status": "stopped",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _cached_utc_iso()
             })
             
             return {"message": "Automation stopped successfully", "status": "stopped"}
@@ -1185,7 +1469,7 @@ async def toggle_automation(request: AutomationToggleRequest, background_tasks:
         automation_state["status"] = AutomationStatus.ERROR
         raise HTTPException(status_code=500, detail="Error toggling automation")
 
-@app.post("/api/automation/manual-run")
+@app.post("/api/automation/manual-run", dependencies=[Depends(rate_limit)])
 async def manual_run(request: ManualRunRequest, background_tasks: BackgroundTasks):
     """Trigger a manual collection run"""
     try:
@@ -1195,7 +1479,7 @@ async def manual_run(request: ManualRunRequest, background_tasks: BackgroundTask
         await manager.broadcast({
             "type": "manual_run_started",
             "sources": request.sources,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _cached_utc_iso()
         })
         
         return {"message": "Manual collection started", "status": "initiated"}
@@ -1236,4 +1520,23 @@ if __name__ == "__main__":
     print("\nPress CTRL+C to stop the server")
     print("="*60 + "\n")
     
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools come with uvicorn[standard]; multiple workers keep
+    # CSV parsing and other CPU work from serializing all traffic on one loop.
+    # Dead-socket detection rides on RFC 6455 ping/pong control frames, which
+    # uvicorn handles without waking any application code.
+    # Caveat for WEB_WORKERS > 1: WebSocket connections, broadcasts, the
+    # rate-limit counters and the in-process caches are all per worker. A
+    # toggle or discovery run only notifies clients connected to the worker
+    # that handled it, and cached reads on other workers converge via TTL
+    # rather than immediately. Cross-worker fan-out needs a shared broker
+    # (e.g. Redis pub/sub) before raising this for WebSocket-heavy use.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_WORKERS", os.cpu_count() or 2)),
+        loop="uvloop",
+        http="httptools",
+        ws_ping_interval=20,
+        ws_ping_timeout=20
+    )